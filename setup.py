@@ -0,0 +1,22 @@
+"""Optional native build for the deep-diff hot path.
+
+Project metadata lives in ``pyproject.toml``. This file only adds an opt-in
+mypyc build of ``resource_analyzer.diff``; when the compiled module is absent
+the pure-Python source is imported as usual.
+
+    RESOURCE_ANALYZER_MYPYC=1 pip install --no-build-isolation -e .
+"""
+
+from __future__ import annotations
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("RESOURCE_ANALYZER_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["src/resource_analyzer/diff.py"], opt_level="3")
+
+setup(ext_modules=ext_modules)
@@ -3,14 +3,29 @@
 from __future__ import annotations
 
 import argparse
+import io
 import sys
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Sequence
-
-from resource_analyzer.diff import MatchKeyError, analyze_resources, resolve_match_key
-from resource_analyzer.loader import LoaderError, extract_resources, load_json_file
-from resource_analyzer.models import ResourceReport
-from resource_analyzer.utils import to_json_text, upload_report_to_s3, utc_now_iso8601
+from typing import Any, BinaryIO, Iterable, Iterator, Sequence
+
+from resource_analyzer.diff import (
+    MatchKeyError,
+    analyze_against_lookup_dict,
+    analyze_against_lookup_parallel,
+    build_iac_lookup,
+    build_iac_lookup_streaming,
+    require_match_key,
+    resolve_match_key,
+)
+from resource_analyzer.loader import LoaderError, iter_resources
+from resource_analyzer.models import resource_report_dict
+from resource_analyzer.utils import (
+    stream_json_array,
+    to_json_bytes,
+    upload_report_to_s3,
+    utc_now_iso8601,
+)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -44,6 +59,15 @@ def build_parser() -> argparse.ArgumentParser:
             "'array' prints only resource comparison entries."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes used to compare resources (default: 1). "
+            "Values above 1 help on large inputs."
+        ),
+    )
 
     parser.add_argument(
         "--upload-s3",
@@ -57,6 +81,11 @@ def build_parser() -> argparse.ArgumentParser:
         default="http://localhost:4566",
         help="S3 endpoint URL (default: http://localhost:4566)",
     )
+    parser.add_argument(
+        "--assume-bucket-exists",
+        action="store_true",
+        help="Skip checking/creating the S3 bucket before upload",
+    )
 
     return parser
 
@@ -69,46 +98,68 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     if args.upload_s3 and (not args.bucket or not args.key):
         parser.error("--upload-s3 requires both --bucket and --key.")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1.")
 
     try:
-        cloud_payload = load_json_file(args.cloud)
-        iac_payload = load_json_file(args.iac)
+        cloud_resources = list(
+            iter_resources(args.cloud, source_name=f"cloud ({args.cloud})")
+        )
+        iac_stream = iter_resources(args.iac, source_name=f"iac ({args.iac})")
+
+        if args.match_key:
+            match_key = args.match_key
+            # Validate the cloud side before consuming the IaC stream so a
+            # missing key is reported ahead of any IaC lookup error. Every IaC
+            # resource carrying the key lands in the lookup, so its values stand
+            # in for the IaC dataset.
+            require_match_key(cloud_resources, match_key)
+            iac_lookup = build_iac_lookup_streaming(iac_stream, match_key)
+            require_match_key(iac_lookup.values(), match_key)
+        else:
+            iac_resources = list(iac_stream)
+            match_key = resolve_match_key(
+                cloud_resources=cloud_resources,
+                iac_resources=iac_resources,
+                requested_key=None,
+            )
+            iac_lookup = build_iac_lookup(iac_resources, match_key)
 
-        cloud_resources = extract_resources(cloud_payload, source_name=f"cloud ({args.cloud})")
-        iac_resources = extract_resources(iac_payload, source_name=f"iac ({args.iac})")
+        if args.workers > 1:
+            report_items: Iterable[dict[str, Any]] = analyze_against_lookup_parallel(
+                cloud_resources, iac_lookup, match_key, workers=args.workers
+            )
+        else:
+            report_items = analyze_against_lookup_dict(cloud_resources, iac_lookup, match_key)
 
-        match_key = resolve_match_key(
-            cloud_resources=cloud_resources,
-            iac_resources=iac_resources,
-            requested_key=args.match_key,
-        )
+        if args.format == "array" and not args.upload_s3:
+            # Nothing else needs the whole document, so write items as they are built.
+            with _open_output(args.out) as handle:
+                stream_json_array(report_items, handle, pretty=args.pretty)
+                handle.write(b"\n")
+            return 0
 
-        report_items = analyze_resources(cloud_resources, iac_resources, match_key)
         if args.format == "array":
-            report_payload = [item.to_dict() for item in report_items]
-        else:
-            report_payload = ResourceReport(
-                generatedAt=utc_now_iso8601(),
-                matchKeyUsed=match_key,
-                totalResources=len(cloud_resources),
-                items=report_items,
-            ).to_dict()
-
-        report_json = to_json_text(report_payload, pretty=args.pretty)
-
-        if args.out:
-            out_path = Path(args.out)
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            out_path.write_text(report_json + "\n", encoding="utf-8")
+            report_payload: Any = list(report_items)
         else:
-            print(report_json)
+            report_payload = resource_report_dict(
+                generated_at=utc_now_iso8601(),
+                match_key_used=match_key,
+                total_resources=len(cloud_resources),
+                resources=list(report_items),
+            )
+
+        report_body = to_json_bytes(report_payload, pretty=args.pretty)
+        with _open_output(args.out) as handle:
+            handle.write(report_body + b"\n")
 
         if args.upload_s3:
             upload_report_to_s3(
-                report_json=report_json,
+                report_json=report_body,
                 bucket=args.bucket,
                 key=args.key,
                 endpoint_url=args.endpoint_url,
+                verify_bucket=not args.assume_bucket_exists,
             )
 
     except (LoaderError, MatchKeyError, RuntimeError, OSError) as exc:
@@ -116,3 +167,34 @@ def main(argv: Sequence[str] | None = None) -> int:
         return 1
 
     return 0
+
+
+@contextmanager
+def _open_output(out: str | None) -> Iterator[BinaryIO]:
+    """Yield a binary handle for the report: ``out`` if given, else stdout.
+
+    A stdout without a ``buffer`` (e.g. under ``redirect_stdout``) gets the
+    report collected in memory and written to it as text.
+    """
+
+    if out:
+        out_path = Path(out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with out_path.open("wb") as handle:
+            yield handle
+        return
+
+    stdout_buffer = getattr(sys.stdout, "buffer", None)
+    if stdout_buffer is None:
+        collected = io.BytesIO()
+        try:
+            yield collected
+        finally:
+            sys.stdout.write(collected.getvalue().decode("utf-8"))
+            sys.stdout.flush()
+        return
+
+    try:
+        yield stdout_buffer
+    finally:
+        stdout_buffer.flush()
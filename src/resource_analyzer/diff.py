@@ -2,12 +2,31 @@
 
 from __future__ import annotations
 
-from typing import Any, Hashable
-
-from resource_analyzer.models import ChangeLogEntry, ReportItem
+import os
+from itertools import islice
+from typing import Any, Collection, Hashable, Iterable, Iterator, Mapping
+
+from resource_analyzer.models import (
+    ChangeLogEntry,
+    ReportItem,
+    State,
+    change_log_entry_dict,
+    report_item_dict,
+)
 
 IDENTIFIER_PREFERENCE: tuple[str, ...] = ("id", "resourceId", "arn", "name")
 _MISSING = object()
+# (keyName, cloudValue, iacValue) as collected by the diff walk.
+_RawDifference = tuple[str, Any, Any]
+# JSON scalar types are always hashable; checking them first avoids raising
+# and catching TypeError on the common path.
+_HASHABLE_SCALARS: tuple[type, ...] = (str, int, float, bool, bytes, type(None))
+# Leading records inspected before match-key auto-detection scans a whole dataset.
+_KEY_SAMPLE_SIZE = 32
+
+# Per-process state for parallel analysis, set once by ``_init_worker``.
+_worker_lookup: Mapping[Hashable, dict[str, Any]] = {}
+_worker_match_key = ""
 
 
 class MatchKeyError(ValueError):
@@ -15,8 +34,8 @@ class MatchKeyError(ValueError):
 
 
 def resolve_match_key(
-    cloud_resources: list[dict[str, Any]],
-    iac_resources: list[dict[str, Any]],
+    cloud_resources: Collection[dict[str, Any]],
+    iac_resources: Collection[dict[str, Any]],
     requested_key: str | None,
 ) -> str:
     """Resolve the match key from CLI input or auto-detection.
@@ -26,19 +45,14 @@ def resolve_match_key(
     """
 
     if requested_key:
-        if _key_exists_in_dataset(cloud_resources, requested_key) and _key_exists_in_dataset(
-            iac_resources, requested_key
-        ):
-            return requested_key
-        raise MatchKeyError(
-            f"Match key '{requested_key}' was not found in both datasets. "
-            "Provide a key that exists in both cloud and IaC resources."
-        )
+        require_match_key(cloud_resources, requested_key)
+        require_match_key(iac_resources, requested_key)
+        return requested_key
 
+    cloud_keys = _DatasetKeys(cloud_resources)
+    iac_keys = _DatasetKeys(iac_resources)
     for key in IDENTIFIER_PREFERENCE:
-        if _key_exists_in_dataset(cloud_resources, key) and _key_exists_in_dataset(
-            iac_resources, key
-        ):
+        if key in cloud_keys and key in iac_keys:
             return key
 
     ordered_keys = ", ".join(IDENTIFIER_PREFERENCE)
@@ -48,6 +62,16 @@ def resolve_match_key(
     )
 
 
+def require_match_key(resources: Collection[dict[str, Any]], key: str) -> None:
+    """Raise :class:`MatchKeyError` unless ``key`` exists in at least one resource."""
+
+    if not _key_exists_in_dataset(resources, key):
+        raise MatchKeyError(
+            f"Match key '{key}' was not found in both datasets. "
+            "Provide a key that exists in both cloud and IaC resources."
+        )
+
+
 def analyze_resources(
     cloud_resources: list[dict[str, Any]],
     iac_resources: list[dict[str, Any]],
@@ -59,6 +83,16 @@ def analyze_resources(
     """
 
     iac_lookup = build_iac_lookup(iac_resources, match_key)
+    return analyze_against_lookup(cloud_resources, iac_lookup, match_key)
+
+
+def analyze_against_lookup(
+    cloud_resources: Iterable[dict[str, Any]],
+    iac_lookup: Mapping[Hashable, dict[str, Any]],
+    match_key: str,
+) -> list[ReportItem]:
+    """Compare cloud resources against a prebuilt IaC lookup table."""
+
     items: list[ReportItem] = []
 
     for cloud_item in cloud_resources:
@@ -87,7 +121,7 @@ def analyze_resources(
             continue
 
         change_log = deep_diff(cloud_item, iac_item)
-        state = "Match" if not change_log else "Modified"
+        state: State = "Match" if not change_log else "Modified"
         items.append(
             ReportItem(
                 cloudResourceItem=cloud_item,
@@ -100,10 +134,117 @@ def analyze_resources(
     return items
 
 
+def analyze_resources_dict(
+    cloud_resources: Iterable[dict[str, Any]],
+    iac_resources: list[dict[str, Any]],
+    match_key: str,
+) -> Iterator[dict[str, Any]]:
+    """Compare resources and yield report items as JSON-ready dictionaries.
+
+    Equivalent to ``[item.to_dict() for item in analyze_resources(...)]`` but
+    skips the intermediate dataclasses, for callers that only serialize.
+    """
+
+    iac_lookup = build_iac_lookup(iac_resources, match_key)
+    return analyze_against_lookup_dict(cloud_resources, iac_lookup, match_key)
+
+
+def analyze_against_lookup_dict(
+    cloud_resources: Iterable[dict[str, Any]],
+    iac_lookup: Mapping[Hashable, dict[str, Any]],
+    match_key: str,
+) -> Iterator[dict[str, Any]]:
+    """Yield JSON-ready report items compared against a prebuilt IaC lookup."""
+
+    for cloud_item in cloud_resources:
+        iac_item = _find_iac_item(cloud_item, iac_lookup, match_key)
+        if iac_item is None:
+            yield report_item_dict(cloud_item, None, "Missing", [])
+            continue
+
+        state, change_log = _compare_items(cloud_item, iac_item)
+        yield report_item_dict(cloud_item, iac_item, state, change_log)
+
+
+def analyze_against_lookup_parallel(
+    cloud_resources: list[dict[str, Any]],
+    iac_lookup: Mapping[Hashable, dict[str, Any]],
+    match_key: str,
+    workers: int,
+) -> list[dict[str, Any]]:
+    """Like :func:`analyze_against_lookup_dict`, sharded across worker processes.
+
+    ``workers`` is capped at the CPU count. Cloud resources are split into one
+    contiguous chunk per worker. The IaC lookup is pickled once per worker
+    process rather than once per chunk, and workers send back only each item's
+    state and change log; the report dicts are assembled here. Output order
+    matches the input order.
+    """
+
+    workers = min(workers, os.cpu_count() or 1)
+    if workers <= 1 or len(cloud_resources) <= 1:
+        return list(analyze_against_lookup_dict(cloud_resources, iac_lookup, match_key))
+
+    # Imported here: pulling in multiprocessing costs noticeable startup time
+    # for the default single-process run.
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunk_size = -(-len(cloud_resources) // workers)
+    chunks = [
+        cloud_resources[start : start + chunk_size]
+        for start in range(0, len(cloud_resources), chunk_size)
+    ]
+    outcomes: list[tuple[State, list[dict[str, Any]]]] = []
+    with ProcessPoolExecutor(
+        max_workers=len(chunks),
+        initializer=_init_worker,
+        initargs=(iac_lookup, match_key),
+    ) as executor:
+        for chunk_outcomes in executor.map(_diff_chunk, chunks):
+            outcomes.extend(chunk_outcomes)
+
+    items: list[dict[str, Any]] = []
+    for cloud_item, (state, change_log) in zip(cloud_resources, outcomes):
+        iac_item = None
+        if state != "Missing":
+            iac_item = _find_iac_item(cloud_item, iac_lookup, match_key)
+        items.append(report_item_dict(cloud_item, iac_item, state, change_log))
+    return items
+
+
 def build_iac_lookup(
     iac_resources: list[dict[str, Any]], match_key: str
 ) -> dict[Hashable, dict[str, Any]]:
-    """Build an IaC lookup table for O(1) matching by key value."""
+    """Build an IaC lookup table for O(1) matching by key value.
+
+    The common case (hashable, unique keys) is built in a single ``dict()``
+    call. Any anomaly falls back to the incremental builder, which reports the
+    first offending resource with the usual error message.
+    """
+
+    pairs = [
+        (resource[match_key], resource)
+        for resource in iac_resources
+        if match_key in resource
+    ]
+    try:
+        lookup: dict[Hashable, dict[str, Any]] = dict(pairs)
+    except TypeError:
+        return build_iac_lookup_streaming(iac_resources, match_key)
+
+    if len(lookup) != len(pairs):
+        return build_iac_lookup_streaming(iac_resources, match_key)
+    return lookup
+
+
+def build_iac_lookup_streaming(
+    iac_resources: Iterable[dict[str, Any]], match_key: str
+) -> dict[Hashable, dict[str, Any]]:
+    """Build an IaC lookup table while consuming resources one at a time.
+
+    Suitable for generators such as :func:`resource_analyzer.loader.iter_resources`,
+    so the IaC dataset never needs to be materialized as a list.
+    """
 
     lookup: dict[Hashable, dict[str, Any]] = {}
     for index, resource in enumerate(iac_resources):
@@ -134,91 +275,147 @@ def deep_diff(cloud_value: Any, iac_value: Any, path: str = "") -> list[ChangeLo
     List ordering matters: list elements are compared by index.
     """
 
-    differences: list[ChangeLogEntry] = []
+    differences: list[_RawDifference] = []
     _walk_differences(cloud_value, iac_value, path, differences)
-    return differences
+    return [ChangeLogEntry(*entry) for entry in differences]
 
 
 def _walk_differences(
     cloud_value: Any,
     iac_value: Any,
     path: str,
-    differences: list[ChangeLogEntry],
+    differences: list[_RawDifference],
 ) -> None:
-    """Recursively traverse two JSON-like values and collect diffs."""
+    """Recursively traverse two JSON-like values and collect diffs.
+
+    Differences are collected as ``(key_name, cloud_value, iac_value)`` tuples;
+    callers turn them into :class:`ChangeLogEntry` objects or plain dicts.
+    """
+
+    if cloud_value is iac_value:
+        return
 
     if isinstance(cloud_value, dict) and isinstance(iac_value, dict):
-        all_keys = sorted(set(cloud_value.keys()) | set(iac_value.keys()))
-        for key in all_keys:
+        # Cloud keys first, then keys that only exist on the IaC side, both in
+        # document order so the change log is stable without sorting.
+        for key, cloud_child in cloud_value.items():
             child_path = f"{path}.{key}" if path else key
-            cloud_child = cloud_value.get(key, _MISSING)
             iac_child = iac_value.get(key, _MISSING)
-
-            if cloud_child is _MISSING or iac_child is _MISSING:
-                differences.append(
-                    ChangeLogEntry(
-                        keyName=child_path,
-                        cloudValue=None if cloud_child is _MISSING else cloud_child,
-                        iacValue=None if iac_child is _MISSING else iac_child,
-                    )
-                )
-                continue
-
-            _walk_differences(cloud_child, iac_child, child_path, differences)
+            if iac_child is _MISSING:
+                differences.append((child_path, cloud_child, None))
+            else:
+                _walk_differences(cloud_child, iac_child, child_path, differences)
+
+        for key, iac_child in iac_value.items():
+            if key not in cloud_value:
+                differences.append((f"{path}.{key}" if path else key, None, iac_child))
         return
 
     if isinstance(cloud_value, list) and isinstance(iac_value, list):
-        max_len = max(len(cloud_value), len(iac_value))
-        for index in range(max_len):
-            child_path = f"{path}[{index}]" if path else f"[{index}]"
-            if index >= len(cloud_value):
-                differences.append(
-                    ChangeLogEntry(
-                        keyName=child_path,
-                        cloudValue=None,
-                        iacValue=iac_value[index],
-                    )
-                )
-                continue
-            if index >= len(iac_value):
-                differences.append(
-                    ChangeLogEntry(
-                        keyName=child_path,
-                        cloudValue=cloud_value[index],
-                        iacValue=None,
-                    )
-                )
-                continue
-            _walk_differences(cloud_value[index], iac_value[index], child_path, differences)
+        for index, (cloud_child, iac_child) in enumerate(zip(cloud_value, iac_value)):
+            _walk_differences(cloud_child, iac_child, f"{path}[{index}]", differences)
+
+        # At most one of the two tails is non-empty.
+        cloud_len = len(cloud_value)
+        iac_len = len(iac_value)
+        for index, cloud_child in enumerate(cloud_value[iac_len:], iac_len):
+            differences.append((f"{path}[{index}]", cloud_child, None))
+        for index, iac_child in enumerate(iac_value[cloud_len:], cloud_len):
+            differences.append((f"{path}[{index}]", None, iac_child))
         return
 
-    if not _values_equal_strict(cloud_value, iac_value):
-        differences.append(
-            ChangeLogEntry(
-                keyName=path or "$",
-                cloudValue=cloud_value,
-                iacValue=iac_value,
-            )
-        )
+    # Strict comparison: values match only if both type and value match.
+    if type(cloud_value) is not type(iac_value) or cloud_value != iac_value:
+        differences.append((path or "$", cloud_value, iac_value))
+
+
+def _find_iac_item(
+    cloud_item: dict[str, Any],
+    iac_lookup: Mapping[Hashable, dict[str, Any]],
+    match_key: str,
+) -> dict[str, Any] | None:
+    """Return the IaC resource matching ``cloud_item``, or ``None`` if there is none."""
+
+    cloud_key = cloud_item.get(match_key, _MISSING)
+    if cloud_key is _MISSING or not _is_hashable(cloud_key):
+        return None
+    return iac_lookup.get(cloud_key)
+
 
+def _compare_items(
+    cloud_item: dict[str, Any], iac_item: dict[str, Any]
+) -> tuple[State, list[dict[str, Any]]]:
+    """Diff a matched pair and return its state and JSON-ready change log."""
 
-def _key_exists_in_dataset(resources: list[dict[str, Any]], key: str) -> bool:
+    differences: list[_RawDifference] = []
+    _walk_differences(cloud_item, iac_item, "", differences)
+    state: State = "Match" if not differences else "Modified"
+    return state, [change_log_entry_dict(*entry) for entry in differences]
+
+
+def _init_worker(iac_lookup: Mapping[Hashable, dict[str, Any]], match_key: str) -> None:
+    """Store the shared IaC lookup and match key in a worker process."""
+
+    global _worker_lookup, _worker_match_key
+    _worker_lookup = iac_lookup
+    _worker_match_key = match_key
+
+
+def _diff_chunk(chunk: list[dict[str, Any]]) -> list[tuple[State, list[dict[str, Any]]]]:
+    """Return ``(state, change_log)`` for each cloud resource in a worker's chunk."""
+
+    outcomes: list[tuple[State, list[dict[str, Any]]]] = []
+    for cloud_item in chunk:
+        iac_item = _find_iac_item(cloud_item, _worker_lookup, _worker_match_key)
+        if iac_item is None:
+            outcomes.append(("Missing", []))
+        else:
+            outcomes.append(_compare_items(cloud_item, iac_item))
+    return outcomes
+
+
+def _key_exists_in_dataset(resources: Collection[dict[str, Any]], key: str) -> bool:
     """Check whether key exists in at least one resource object."""
 
     return any(key in item for item in resources)
 
 
+def _dataset_keys(resources: Iterable[dict[str, Any]]) -> set[str]:
+    """Collect every key used by any resource object in a single pass."""
+
+    return set().union(*resources)
+
+
+class _DatasetKeys:
+    """Key membership for a dataset, scanning every resource only on a miss.
+
+    Membership is first checked against the keys of a small leading sample, so
+    the common case (the identifier appears in the first records) stays cheap.
+    The full key set is built once, lazily, for keys missing from the sample.
+    """
+
+    def __init__(self, resources: Collection[dict[str, Any]]) -> None:
+        self._resources = resources
+        self._sample = _dataset_keys(islice(resources, _KEY_SAMPLE_SIZE))
+        self._all: set[str] | None = None
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._sample:
+            return True
+        if self._all is None:
+            self._all = _dataset_keys(self._resources)
+        return key in self._all
+
+
 def _is_hashable(value: Any) -> bool:
     """Check whether a value can be used as a dictionary key."""
 
+    if isinstance(value, _HASHABLE_SCALARS):
+        return True
+    if isinstance(value, (dict, list)):
+        return False
     try:
         hash(value)
     except TypeError:
         return False
     return True
-
-
-def _values_equal_strict(cloud_value: Any, iac_value: Any) -> bool:
-    """Strict comparison: values match only if both type and value match."""
-
-    return type(cloud_value) is type(iac_value) and cloud_value == iac_value
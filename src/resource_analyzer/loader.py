@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterator
 
 RESOURCE_CONTAINER_KEYS: tuple[str, ...] = ("resources", "items", "data")
+# Files smaller than this are parsed in one ``json.loads`` call, which beats
+# incremental parsing on speed; larger files are streamed when ijson is available.
+STREAMING_THRESHOLD_BYTES = 64 * 1024 * 1024
 
 
 class LoaderError(ValueError):
@@ -28,8 +31,7 @@ def load_json_file(path: str | Path) -> Any:
 
     file_path = Path(path)
     try:
-        with file_path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return json.loads(file_path.read_bytes())
     except FileNotFoundError as exc:
         raise LoaderError(f"JSON file not found: {file_path}") from exc
     except json.JSONDecodeError as exc:
@@ -68,29 +70,162 @@ def extract_resources(payload: Any, source_name: str) -> list[dict[str, Any]]:
                     candidate, source_name, f"object['{key}']"
                 )
 
-        supported = ", ".join(RESOURCE_CONTAINER_KEYS)
-        raise LoaderError(
-            f"Could not find a resource list in {source_name}. "
-            f"Expected a top-level list or an object with one of: {supported}."
-        )
+        raise _missing_container_error(source_name)
 
-    raise LoaderError(
-        f"Unsupported JSON structure in {source_name}. "
-        f"Expected list or object, got {type(payload).__name__}."
-    )
+    raise _unsupported_structure_error(source_name, type(payload).__name__)
+
+
+def iter_resources(path: str | Path, source_name: str) -> Iterator[dict[str, Any]]:
+    """Return an iterator over the resource objects in a JSON file.
+
+    Accepts the same shapes as :func:`extract_resources`. Files of at least
+    ``STREAMING_THRESHOLD_BYTES`` are streamed with ``ijson`` when it is
+    installed, so neither the raw document nor the full object tree is held in
+    memory. Smaller files, or any file without ``ijson``, go through
+    :func:`load_json_file` + :func:`extract_resources` up front. A missing
+    file, and any error in an eagerly read one, is raised by this call rather
+    than on first iteration.
+
+    Streamed input keeps standard library semantics: if ijson rejects the
+    document (e.g. ``NaN``/``Infinity`` or integers wider than 64 bits, which
+    the C backend does not support), it is re-parsed with ``json`` and the
+    remaining resources are yielded from the same container. Container keys
+    keep the ``resources`` > ``items`` > ``data`` precedence of
+    :func:`extract_resources` regardless of file size.
+
+    Args:
+        path: File system path to a JSON file.
+        source_name: Human-readable source label for error messages.
+
+    Returns:
+        Iterator of resource dictionaries in document order.
+
+    Raises:
+        LoaderError: If file cannot be read, parsed, or normalized.
+    """
+
+    file_path = Path(path)
+    try:
+        size = file_path.stat().st_size
+    except FileNotFoundError as exc:
+        raise LoaderError(f"JSON file not found: {file_path}") from exc
+
+    if size >= STREAMING_THRESHOLD_BYTES:
+        try:
+            import ijson
+        except ImportError:
+            pass
+        else:
+            return _stream_resources(ijson, file_path, source_name)
+
+    return iter(extract_resources(load_json_file(file_path), source_name))
+
+
+def _stream_resources(
+    ijson: Any, file_path: Path, source_name: str
+) -> Iterator[dict[str, Any]]:
+    """Yield resources from ``file_path`` with ijson; see :func:`iter_resources`."""
+
+    located: tuple[str | None, str] | None = None
+    yielded = 0
+    try:
+        with file_path.open("rb") as handle:
+            located = _locate_resource_container(ijson, handle, source_name)
+            container, context = located
+            prefix = "item" if container is None else f"{container}.item"
+            handle.seek(0)
+            items = ijson.items(handle, prefix, use_float=True)
+            for index, item in enumerate(items):
+                if not isinstance(item, dict):
+                    raise _invalid_resource_error(index, item, source_name, context)
+                yield item
+                yielded += 1
+    except FileNotFoundError as exc:
+        raise LoaderError(f"JSON file not found: {file_path}") from exc
+    except ijson.JSONError:
+        # Either input the stdlib accepts but yajl does not, or genuinely
+        # invalid JSON; load_json_file handles both the same way it always has.
+        payload = load_json_file(file_path)
+        if located is None:
+            yield from extract_resources(payload, source_name)
+            return
+        container, context = located
+        candidate = payload if container is None else payload[container]
+        resources = _validate_resource_list(candidate, source_name, context)
+        yield from resources[yielded:]
+
+
+def _locate_resource_container(
+    ijson: Any, handle: BinaryIO, source_name: str
+) -> tuple[str | None, str]:
+    """Find the resource list's container key without building any objects.
+
+    Returns ``None`` as the key for a top-level list. For a top-level object
+    the key is chosen with the same precedence as :func:`extract_resources`.
+    The scan stops as soon as a ``resources`` list is seen; otherwise the rest
+    of the document has to be tokenized to rule out a higher-precedence key.
+    """
+
+    events = ijson.parse(handle, use_float=True)
+    _, first_event, first_value = next(events)
+    if first_event == "start_array":
+        return None, "top-level list"
+    if first_event != "start_map":
+        raise _unsupported_structure_error(source_name, type(first_value).__name__)
+
+    best: str | None = None
+    for prefix, event, _ in events:
+        if event == "start_array" and prefix in RESOURCE_CONTAINER_KEYS:
+            if best is None or RESOURCE_CONTAINER_KEYS.index(
+                prefix
+            ) < RESOURCE_CONTAINER_KEYS.index(best):
+                best = prefix
+            if best == RESOURCE_CONTAINER_KEYS[0]:
+                break
+
+    if best is None:
+        raise _missing_container_error(source_name)
+    return best, f"object['{best}']"
 
 
 def _validate_resource_list(
     resources: list[Any], source_name: str, context: str
 ) -> list[dict[str, Any]]:
-    """Ensure the extracted list contains only JSON objects."""
+    """Ensure the extracted list contains only JSON objects.
+
+    Valid lists are returned as-is rather than copied. The indexed scan only
+    runs when the fast exact-type check fails, to report the offending item
+    (or to accept ``dict`` subclasses).
+    """
+
+    if all(type(item) is dict for item in resources):
+        return resources
 
-    normalized: list[dict[str, Any]] = []
     for index, item in enumerate(resources):
         if not isinstance(item, dict):
-            raise LoaderError(
-                f"Invalid resource at index {index} in {source_name} ({context}). "
-                f"Expected object, got {type(item).__name__}."
-            )
-        normalized.append(item)
-    return normalized
+            raise _invalid_resource_error(index, item, source_name, context)
+    return resources
+
+
+def _invalid_resource_error(
+    index: int, item: Any, source_name: str, context: str
+) -> LoaderError:
+    return LoaderError(
+        f"Invalid resource at index {index} in {source_name} ({context}). "
+        f"Expected object, got {type(item).__name__}."
+    )
+
+
+def _missing_container_error(source_name: str) -> LoaderError:
+    supported = ", ".join(RESOURCE_CONTAINER_KEYS)
+    return LoaderError(
+        f"Could not find a resource list in {source_name}. "
+        f"Expected a top-level list or an object with one of: {supported}."
+    )
+
+
+def _unsupported_structure_error(source_name: str, type_name: str) -> LoaderError:
+    return LoaderError(
+        f"Unsupported JSON structure in {source_name}. "
+        f"Expected list or object, got {type_name}."
+    )
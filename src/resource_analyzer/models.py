@@ -2,26 +2,13 @@
 
 from __future__ import annotations
 
-import sys
 from dataclasses import dataclass
 from typing import Any, Literal
 
 State = Literal["Missing", "Match", "Modified"]
 
-def model_dataclass() -> Any:
-    """Return a dataclass decorator with safe slots handling.
 
-    Python 3.10+ supports ``slots=True`` in ``dataclass``.
-    For older runtimes (e.g. 3.9), fallback to a regular dataclass so
-    class creation does not fail if compatibility is required later.
-    """
-
-    if sys.version_info >= (3, 10):
-        return dataclass(slots=True)
-    return dataclass()
-
-
-@model_dataclass()
+@dataclass(slots=True, frozen=True)
 class ChangeLogEntry:
     """Represents one field-level difference between cloud and IaC resources."""
 
@@ -31,14 +18,10 @@ class ChangeLogEntry:
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize the changelog entry to a JSON-compatible dictionary."""
-        return {
-            "KeyName": self.keyName,
-            "CloudValue": self.cloudValue,
-            "IacValue": self.iacValue,
-        }
+        return change_log_entry_dict(self.keyName, self.cloudValue, self.iacValue)
 
 
-@model_dataclass()
+@dataclass(slots=True, frozen=True)
 class ReportItem:
     """Comparison result for one cloud resource."""
 
@@ -49,15 +32,15 @@ class ReportItem:
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize the report item to a JSON-compatible dictionary."""
-        return {
-            "CloudResourceItem": self.cloudResourceItem,
-            "IacResourceItem": self.iacResourceItem,
-            "State": self.state,
-            "ChangeLog": [entry.to_dict() for entry in self.changeLog],
-        }
+        return report_item_dict(
+            self.cloudResourceItem,
+            self.iacResourceItem,
+            self.state,
+            [entry.to_dict() for entry in self.changeLog],
+        )
 
 
-@model_dataclass()
+@dataclass(slots=True, frozen=True)
 class ResourceReport:
     """Top-level report output."""
 
@@ -68,9 +51,52 @@ class ResourceReport:
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize the complete report to a JSON-compatible dictionary."""
-        return {
-            "GeneratedAt": self.generatedAt,
-            "MatchKeyUsed": self.matchKeyUsed,
-            "TotalResources": self.totalResources,
-            "Resources": [item.to_dict() for item in self.items],
-        }
+        return resource_report_dict(
+            self.generatedAt,
+            self.matchKeyUsed,
+            self.totalResources,
+            [item.to_dict() for item in self.items],
+        )
+
+
+# Plain-dict builders shared by the dataclass ``to_dict`` methods and the
+# direct-to-dict analysis path, so the output schema is defined only here.
+
+
+def change_log_entry_dict(key_name: str, cloud_value: Any, iac_value: Any) -> dict[str, Any]:
+    """Build the JSON-compatible form of one changelog entry."""
+    return {
+        "KeyName": key_name,
+        "CloudValue": cloud_value,
+        "IacValue": iac_value,
+    }
+
+
+def report_item_dict(
+    cloud_resource_item: dict[str, Any],
+    iac_resource_item: dict[str, Any] | None,
+    state: State,
+    change_log: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Build the JSON-compatible form of one report item."""
+    return {
+        "CloudResourceItem": cloud_resource_item,
+        "IacResourceItem": iac_resource_item,
+        "State": state,
+        "ChangeLog": change_log,
+    }
+
+
+def resource_report_dict(
+    generated_at: str,
+    match_key_used: str,
+    total_resources: int,
+    resources: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Build the JSON-compatible form of the complete report."""
+    return {
+        "GeneratedAt": generated_at,
+        "MatchKeyUsed": match_key_used,
+        "TotalResources": total_resources,
+        "Resources": resources,
+    }
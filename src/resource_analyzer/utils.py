@@ -2,39 +2,103 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, BinaryIO, Iterable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional extra
+    orjson = None
 
 
 def utc_now_iso8601() -> str:
-    """Return current UTC timestamp in ISO8601 format with trailing Z."""
+    """Return current UTC timestamp in ISO8601 format with trailing Z.
+
+    Always includes microseconds, e.g. ``2026-02-12T00:00:00.000000Z``.
+    """
+
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def to_json_bytes(payload: Any, pretty: bool = False) -> bytes:
+    """Serialize payload to UTF-8 encoded JSON.
+
+    Uses ``orjson`` when installed. Report trees only contain ``dict``, ``list``,
+    ``str``, ``int``, ``float``, ``bool`` and ``None``, so no ``default=`` hook
+    is needed. Two caveats against the standard library encoder:
+
+    - integers outside the 64-bit range make orjson fail, so the payload falls
+      back to ``json``;
+    - non-finite floats (``NaN``, ``Infinity``) are written as ``null`` by
+      orjson, where ``json`` writes the non-standard ``NaN``/``Infinity``
+      literals. Detecting them would need a full Python-level walk of the
+      report, costing about as much as the stdlib encoder itself, so this
+      conversion is accepted; install without the ``fast`` extra to keep them.
+    """
 
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except orjson.JSONEncodeError:
+            pass
+    return _json_dumps(payload, pretty).encode("utf-8")
+
+
+def stream_json_array(items: Iterable[Any], handle: BinaryIO, pretty: bool = False) -> None:
+    """Write items to a binary handle as a JSON array, one element at a time.
+
+    Produces the same bytes as ``to_json_bytes(list(items), pretty)`` while only
+    ever holding a single encoded element in memory.
+    """
+
+    opener, separator, closer = (b"[\n  ", b",\n  ", b"\n]") if pretty else (b"[", b",", b"]")
+    wrote_any = False
+    for item in items:
+        encoded = to_json_bytes(item, pretty=pretty)
+        if pretty:
+            # Nest the element one level; JSON strings never contain raw newlines.
+            encoded = encoded.replace(b"\n", b"\n  ")
+        handle.write(separator if wrote_any else opener)
+        handle.write(encoded)
+        wrote_any = True
+    handle.write(closer if wrote_any else b"[]")
 
 
 def to_json_text(payload: Any, pretty: bool = False) -> str:
     """Serialize payload to JSON text."""
 
+    if orjson is not None:
+        return to_json_bytes(payload, pretty=pretty).decode("utf-8")
+    return _json_dumps(payload, pretty)
+
+
+def _json_dumps(payload: Any, pretty: bool) -> str:
     if pretty:
         return json.dumps(payload, indent=2, ensure_ascii=False)
     return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
 
 
 def upload_report_to_s3(
-    report_json: str,
+    report_json: bytes | str,
     bucket: str,
     key: str,
     endpoint_url: str,
+    verify_bucket: bool = True,
 ) -> None:
-    """Upload a resource report JSON string to S3.
+    """Upload a resource report JSON document to S3.
 
     This is primarily intended for LocalStack in local development,
     but also works with real S3 endpoints if credentials are configured.
+
+    ``report_json`` may already be UTF-8 encoded bytes (see ``to_json_bytes``),
+    in which case it is uploaded as-is. Set ``verify_bucket=False`` to skip the
+    ``head_bucket``/``create_bucket`` round-trip when the bucket is known to exist.
     """
 
     try:
-        import boto3
+        import boto3  # noqa: F401
         from botocore.exceptions import ClientError
     except ImportError as exc:
         raise RuntimeError(
@@ -42,28 +106,43 @@ def upload_report_to_s3(
             "Install optional dependency: pip install '.[s3]'"
         ) from exc
 
-    client = boto3.client(
-        "s3",
-        endpoint_url=endpoint_url,
-        aws_access_key_id="test",
-        aws_secret_access_key="test",
-        region_name="us-east-1",
-    )
+    client = _get_s3_client(endpoint_url)
 
-    try:
-        client.head_bucket(Bucket=bucket)
-    except ClientError as exc:
-        error_code = str(exc.response.get("Error", {}).get("Code", ""))
-        if error_code in {"404", "NoSuchBucket", "NotFound"}:
-            client.create_bucket(Bucket=bucket)
-        else:
-            raise RuntimeError(
-                f"Unable to verify bucket '{bucket}' before upload: {exc}"
-            ) from exc
+    if verify_bucket:
+        try:
+            client.head_bucket(Bucket=bucket)
+        except ClientError as exc:
+            error_code = str(exc.response.get("Error", {}).get("Code", ""))
+            if error_code in {"404", "NoSuchBucket", "NotFound"}:
+                client.create_bucket(Bucket=bucket)
+            else:
+                raise RuntimeError(
+                    f"Unable to verify bucket '{bucket}' before upload: {exc}"
+                ) from exc
 
+    body = report_json if isinstance(report_json, bytes) else report_json.encode("utf-8")
     client.put_object(
         Bucket=bucket,
         Key=key,
-        Body=report_json.encode("utf-8"),
+        Body=body,
         ContentType="application/json",
     )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_s3_client(endpoint_url: str, region: str = "us-east-1") -> Any:
+    """Return an S3 client, reused across uploads to the same endpoint.
+
+    Creating a client loads and parses botocore's service model, which costs far
+    more than the upload itself for small reports.
+    """
+
+    import boto3
+
+    return boto3.client(
+        "s3",
+        endpoint_url=endpoint_url,
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+        region_name=region,
+    )
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import io
 import json
 import os
 import subprocess
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 
+import pytest
+
+from resource_analyzer import cli
+
 
 def test_cli_smoke_generates_report_file(tmp_path: Path) -> None:
     cloud = [{"name": "service-a", "spec": {"replicas": 3}}]
@@ -98,3 +104,157 @@ def test_cli_smoke_generates_array_output_format(tmp_path: Path) -> None:
     assert isinstance(payload, list)
     assert payload[0]["State"] == "Modified"
     assert payload[0]["ChangeLog"][0]["KeyName"] == "spec.replicas"
+
+
+def _run_cli(tmp_path: Path, cloud: list, iac: list, *args: str) -> subprocess.CompletedProcess:
+    cloud_path = tmp_path / "cloud.json"
+    iac_path = tmp_path / "iac.json"
+    cloud_path.write_text(json.dumps(cloud), encoding="utf-8")
+    iac_path.write_text(json.dumps(iac), encoding="utf-8")
+
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(Path(__file__).resolve().parents[1] / "src")
+
+    return subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "resource_analyzer",
+            "--cloud",
+            str(cloud_path),
+            "--iac",
+            str(iac_path),
+            *args,
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def test_cli_reports_missing_cloud_match_key_before_iac_duplicates(tmp_path: Path) -> None:
+    cloud = [{"id": "service-a"}]
+    iac = [{"name": "service-a"}, {"name": "service-a"}]
+
+    result = _run_cli(tmp_path, cloud, iac, "--match-key", "name")
+
+    assert result.returncode == 1
+    assert "Match key 'name' was not found in both datasets" in result.stderr
+
+
+def test_cli_reports_missing_iac_file_before_cloud_match_key(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    cloud_path = tmp_path / "cloud.json"
+    cloud_path.write_text(json.dumps([{"id": "service-a"}]), encoding="utf-8")
+    missing_iac = tmp_path / "nope.json"
+
+    exit_code = cli.main(
+        [
+            "--cloud",
+            str(cloud_path),
+            "--iac",
+            str(missing_iac),
+            "--match-key",
+            "name",
+        ]
+    )
+
+    assert exit_code == 1
+    assert f"JSON file not found: {missing_iac}" in capsys.readouterr().err
+
+
+def test_cli_compares_with_multiple_workers(tmp_path: Path) -> None:
+    cloud = [{"name": f"service-{i}", "replicas": i} for i in range(4)]
+    iac = [{"name": f"service-{i}", "replicas": 0} for i in range(3)]
+
+    result = _run_cli(tmp_path, cloud, iac, "--match-key", "name", "--workers", "2")
+
+    assert result.returncode == 0, result.stderr
+    payload = json.loads(result.stdout)
+    assert payload["TotalResources"] == 4
+    assert [item["State"] for item in payload["Resources"]] == [
+        "Match",
+        "Modified",
+        "Modified",
+        "Missing",
+    ]
+
+
+def test_cli_rejects_non_positive_workers(tmp_path: Path) -> None:
+    result = _run_cli(tmp_path, [], [], "--workers", "0")
+
+    assert result.returncode == 2
+    assert "--workers must be at least 1." in result.stderr
+
+
+def test_cli_assume_bucket_exists_skips_bucket_verification(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    uploads: list[dict[str, object]] = []
+    monkeypatch.setattr(cli, "upload_report_to_s3", lambda **kwargs: uploads.append(kwargs))
+    cloud_path = tmp_path / "cloud.json"
+    iac_path = tmp_path / "iac.json"
+    cloud_path.write_text(json.dumps([{"name": "a"}]), encoding="utf-8")
+    iac_path.write_text(json.dumps([{"name": "a"}]), encoding="utf-8")
+
+    exit_code = cli.main(
+        [
+            "--cloud",
+            str(cloud_path),
+            "--iac",
+            str(iac_path),
+            "--out",
+            str(tmp_path / "report.json"),
+            "--upload-s3",
+            "--bucket",
+            "reports",
+            "--key",
+            "latest.json",
+            "--assume-bucket-exists",
+        ]
+    )
+
+    assert exit_code == 0
+    assert uploads[0]["verify_bucket"] is False
+    assert isinstance(uploads[0]["report_json"], bytes)
+
+
+def test_cli_streams_array_output_to_stdout(tmp_path: Path) -> None:
+    cloud = [{"name": "service-a", "spec": {"replicas": 3}}, {"name": "service-b"}]
+    iac = [{"name": "service-a", "spec": {"replicas": 1}}]
+
+    result = _run_cli(tmp_path, cloud, iac, "--match-key", "name", "--format", "array", "--pretty")
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.endswith("]\n")
+    payload = json.loads(result.stdout)
+    assert [item["State"] for item in payload] == ["Modified", "Missing"]
+    assert payload[0]["ChangeLog"][0]["KeyName"] == "spec.replicas"
+
+
+@pytest.mark.parametrize("output_format", ["wrapped", "array"])
+def test_cli_writes_to_text_only_stdout(tmp_path: Path, output_format: str) -> None:
+    cloud_path = tmp_path / "cloud.json"
+    iac_path = tmp_path / "iac.json"
+    cloud_path.write_text(json.dumps([{"id": "a", "size": 2}]), encoding="utf-8")
+    iac_path.write_text(json.dumps([{"id": "a", "size": 1}]), encoding="utf-8")
+
+    captured = io.StringIO()
+    with redirect_stdout(captured):
+        exit_code = cli.main(
+            [
+                "--cloud",
+                str(cloud_path),
+                "--iac",
+                str(iac_path),
+                "--format",
+                output_format,
+            ]
+        )
+
+    assert exit_code == 0
+    payload = json.loads(captured.getvalue())
+    items = payload if output_format == "array" else payload["Resources"]
+    assert [item["State"] for item in items] == ["Modified"]
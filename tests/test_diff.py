@@ -2,7 +2,21 @@
 
 from __future__ import annotations
 
-from resource_analyzer.diff import analyze_resources, resolve_match_key
+import concurrent.futures
+
+import pytest
+
+from resource_analyzer import diff
+from resource_analyzer.diff import (
+    MatchKeyError,
+    analyze_against_lookup_parallel,
+    analyze_resources,
+    analyze_resources_dict,
+    build_iac_lookup,
+    build_iac_lookup_streaming,
+    deep_diff,
+    resolve_match_key,
+)
 
 
 def test_missing_when_cloud_resource_has_no_iac_match() -> None:
@@ -102,3 +116,93 @@ def test_auto_detect_match_key_prefers_configured_order() -> None:
     match_key = resolve_match_key(cloud, iac, requested_key=None)
 
     assert match_key == "id"
+
+
+def test_streaming_lookup_rejects_duplicate_keys() -> None:
+    iac = iter([{"name": "a"}, {"name": "b"}, {"name": "a"}])
+
+    with pytest.raises(MatchKeyError, match="Duplicate IaC match key"):
+        build_iac_lookup_streaming(iac, match_key="name")
+
+
+def test_build_iac_lookup_reports_non_hashable_key_index() -> None:
+    iac = [{"id": "1"}, {"name": "no-id"}, {"id": ["a", "b"]}]
+
+    with pytest.raises(MatchKeyError, match="index 2 has non-hashable"):
+        build_iac_lookup(iac, match_key="id")
+
+
+def test_change_log_follows_document_order() -> None:
+    cloud = [{"name": "svc", "zone": "b", "size": 2, "extra": True}]
+    iac = [{"name": "svc", "owner": "team", "size": 1, "zone": "a"}]
+
+    items = analyze_resources(cloud, iac, match_key="name")
+
+    assert [entry.keyName for entry in items[0].changeLog] == ["zone", "size", "extra", "owner"]
+
+
+def test_list_tail_differences_are_reported_by_index() -> None:
+    cloud = [{"name": "svc", "ports": [80, 443, 8080]}]
+    iac = [{"name": "svc", "ports": [80]}]
+
+    items = analyze_resources(cloud, iac, match_key="name")
+
+    assert [(e.keyName, e.cloudValue, e.iacValue) for e in items[0].changeLog] == [
+        ("ports[1]", 443, None),
+        ("ports[2]", 8080, None),
+    ]
+
+
+def test_dict_analysis_matches_dataclass_serialization() -> None:
+    cloud = [
+        {"name": "svc", "spec": {"replicas": 3, "ports": [80, 443]}},
+        {"name": "orphan"},
+        {"id": "no-name"},
+    ]
+    iac = [{"name": "svc", "spec": {"replicas": 2, "ports": [80]}, "owner": "team"}]
+
+    expected = [item.to_dict() for item in analyze_resources(cloud, iac, match_key="name")]
+
+    assert list(analyze_resources_dict(cloud, iac, match_key="name")) == expected
+
+
+def test_parallel_analysis_preserves_input_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(diff.os, "cpu_count", lambda: 4)
+    cloud = [{"name": f"svc-{i}", "replicas": i} for i in range(7)] + [{"id": "no-name"}]
+    iac = [{"name": f"svc-{i}", "replicas": i % 2} for i in range(6)]
+    lookup = build_iac_lookup(iac, match_key="name")
+
+    expected = list(analyze_resources_dict(cloud, iac, match_key="name"))
+
+    assert analyze_against_lookup_parallel(cloud, lookup, "name", workers=3) == expected
+
+
+def test_parallel_analysis_caps_workers_at_cpu_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(diff.os, "cpu_count", lambda: 2)
+    pool_sizes: list[int] = []
+    real_pool = concurrent.futures.ProcessPoolExecutor
+
+    def recording_pool(max_workers: int, **kwargs: object) -> concurrent.futures.Executor:
+        pool_sizes.append(max_workers)
+        return real_pool(max_workers=max_workers, **kwargs)
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", recording_pool)
+    cloud = [{"name": f"svc-{i}"} for i in range(10)]
+    lookup = build_iac_lookup([{"name": "svc-0"}], match_key="name")
+
+    items = analyze_against_lookup_parallel(cloud, lookup, "name", workers=1000)
+
+    assert pool_sizes == [2]
+    assert [item["State"] for item in items] == ["Match"] + ["Missing"] * 9
+
+
+def test_auto_detect_match_key_finds_keys_beyond_first_resources() -> None:
+    cloud = [{"name": f"r{i}"} for i in range(50)] + [{"name": "r50", "arn": "a"}]
+    iac = [{"arn": "a", "name": "x"}]
+
+    assert resolve_match_key(cloud, iac, requested_key=None) == "arn"
+
+
+def test_deep_diff_paths_for_empty_keys_and_nested_lists() -> None:
+    assert [e.keyName for e in deep_diff({"": {"b": 1}}, {"": {"b": 2}})] == ["b"]
+    assert [e.keyName for e in deep_diff([1, [1, 2]], [2, [1]])] == ["[0]", "[1][1]"]
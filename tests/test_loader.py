@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import json
+from pathlib import Path
+
 import pytest
 
-from resource_analyzer.loader import LoaderError, extract_resources
+from resource_analyzer import loader
+from resource_analyzer.loader import LoaderError, extract_resources, iter_resources
 
 
 def test_extract_resources_from_top_level_list() -> None:
@@ -28,3 +32,114 @@ def test_extract_resources_invalid_shape_raises_error() -> None:
 
     with pytest.raises(LoaderError, match="Could not find a resource list"):
         extract_resources(payload, source_name="iac.json")
+
+
+def test_iter_resources_prefers_container_key_order(tmp_path: Path) -> None:
+    path = tmp_path / "iac.json"
+    path.write_text(
+        json.dumps({"items": [{"id": "x"}], "resources": [{"id": "1", "cpu": 0.5}]}),
+        encoding="utf-8",
+    )
+
+    resources = list(iter_resources(path, source_name="iac.json"))
+
+    assert resources == [{"id": "1", "cpu": 0.5}]
+
+
+def test_iter_resources_rejects_non_object_items(tmp_path: Path) -> None:
+    path = tmp_path / "cloud.json"
+    path.write_text(json.dumps([{"id": "1"}, "oops"]), encoding="utf-8")
+
+    with pytest.raises(LoaderError, match="Invalid resource at index 1"):
+        list(iter_resources(path, source_name="cloud.json"))
+
+
+def test_extract_resources_reports_index_of_invalid_item() -> None:
+    payload = {"items": [{"id": "1"}, {"id": "2"}, 3]}
+
+    with pytest.raises(LoaderError, match="index 2 .* got int"):
+        extract_resources(payload, source_name="cloud.json")
+
+
+def test_iter_resources_streams_large_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("ijson")
+    monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+    path = tmp_path / "cloud.json"
+    path.write_text(
+        json.dumps({"items": "not-a-list", "data": [{"id": "1", "size": 1.5}, [2]]}),
+        encoding="utf-8",
+    )
+
+    stream = iter_resources(path, source_name="cloud.json")
+
+    assert next(stream) == {"id": "1", "size": 1.5}
+    with pytest.raises(LoaderError, match=r"index 1 in cloud.json \(object\['data'\]\)"):
+        next(stream)
+
+
+def test_iter_resources_streaming_keeps_stdlib_number_semantics(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("ijson")
+    monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+    path = tmp_path / "cloud.json"
+    path.write_text(
+        '{"resources": [{"id": "1"}, {"id": "2", "big": %d, "ratio": NaN}]}' % 2**70,
+        encoding="utf-8",
+    )
+
+    resources = list(iter_resources(path, source_name="cloud.json"))
+
+    assert [r["id"] for r in resources] == ["1", "2"]
+    assert resources[1]["big"] == 2**70
+    assert resources[1]["ratio"] != resources[1]["ratio"]
+
+
+@pytest.mark.parametrize(
+    "document, expected_ids",
+    [
+        (
+            '{"items": [{"id": "a"}, {"id": "b"}, {"id": "c", "v": NaN}],'
+            ' "resources": [{"id": "x"}, {"id": "y"}]}',
+            ["x", "y"],
+        ),
+        (
+            '{"data": [{"id": "a"}], "items": [{"id": "b"}, {"id": "c", "v": NaN}]}',
+            ["b", "c"],
+        ),
+        (
+            '{"items": [{"id": "x"}],'
+            ' "resources": [{"id": "a"}, {"id": "b", "v": NaN}]}',
+            ["a", "b"],
+        ),
+    ],
+)
+def test_iter_resources_streaming_matches_stdlib_container_choice(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    document: str,
+    expected_ids: list[str],
+) -> None:
+    pytest.importorskip("ijson")
+    path = tmp_path / "iac.json"
+    path.write_text(document, encoding="utf-8")
+
+    small = [r["id"] for r in iter_resources(path, source_name="iac.json")]
+    monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+    streamed = [r["id"] for r in iter_resources(path, source_name="iac.json")]
+
+    assert small == streamed == expected_ids
+
+
+def test_iter_resources_streaming_reports_invalid_json(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("ijson")
+    monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+    path = tmp_path / "cloud.json"
+    path.write_text('[{"id": "1"},', encoding="utf-8")
+
+    with pytest.raises(LoaderError, match="Invalid JSON"):
+        list(iter_resources(path, source_name="cloud.json"))
@@ -0,0 +1,106 @@
+"""Tests for serialization helpers."""
+
+from __future__ import annotations
+
+import io
+import json
+import math
+import re
+
+import pytest
+
+from resource_analyzer import utils
+from resource_analyzer.utils import (
+    _get_s3_client,
+    stream_json_array,
+    to_json_bytes,
+    to_json_text,
+    upload_report_to_s3,
+    utc_now_iso8601,
+)
+
+
+def test_to_json_bytes_matches_stdlib_output() -> None:
+    payload = {"Resources": [{"State": "Match", "Tags": {"owner": "plätform"}, "Size": 1.5}]}
+
+    assert to_json_bytes(payload) == json.dumps(
+        payload, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+    assert to_json_bytes(payload, pretty=True) == json.dumps(
+        payload, indent=2, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def test_to_json_text_handles_integers_beyond_64_bits() -> None:
+    payload = {"CloudValue": 2**70}
+
+    assert json.loads(to_json_text(payload)) == payload
+
+
+def test_s3_client_is_reused_per_endpoint() -> None:
+    pytest.importorskip("boto3")
+
+    first = _get_s3_client("http://localhost:4566")
+
+    assert _get_s3_client("http://localhost:4566") is first
+    assert _get_s3_client("http://localhost:4567") is not first
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+@pytest.mark.parametrize("count", [0, 1, 3])
+def test_stream_json_array_matches_full_serialization(pretty: bool, count: int) -> None:
+    items = [
+        {"State": "Modified", "ChangeLog": [{"KeyName": f"k{i}"}], "Tags": {}}
+        for i in range(count)
+    ]
+    handle = io.BytesIO()
+
+    stream_json_array(iter(items), handle, pretty=pretty)
+
+    assert handle.getvalue() == to_json_bytes(items, pretty=pretty)
+
+
+def test_utc_now_iso8601_has_fixed_width_format() -> None:
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z", utc_now_iso8601())
+
+
+def test_to_json_bytes_non_finite_floats_depend_on_encoder() -> None:
+    payload = {"CloudValue": math.nan, "IacValue": math.inf}
+
+    if utils.orjson is not None:
+        assert to_json_bytes(payload) == b'{"CloudValue":null,"IacValue":null}'
+    else:
+        assert to_json_bytes(payload) == b'{"CloudValue":NaN,"IacValue":Infinity}'
+
+
+class _StubS3Client:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, object]]] = []
+
+    def head_bucket(self, **kwargs: object) -> None:
+        self.calls.append(("head_bucket", kwargs))
+
+    def put_object(self, **kwargs: object) -> None:
+        self.calls.append(("put_object", kwargs))
+
+
+@pytest.mark.parametrize("verify_bucket", [True, False])
+def test_upload_report_to_s3_passes_bytes_and_honors_verify_bucket(
+    monkeypatch: pytest.MonkeyPatch, verify_bucket: bool
+) -> None:
+    pytest.importorskip("boto3")
+    client = _StubS3Client()
+    monkeypatch.setattr(utils, "_get_s3_client", lambda endpoint_url: client)
+    body = b'{"Resources":[]}'
+
+    upload_report_to_s3(
+        report_json=body,
+        bucket="reports",
+        key="latest.json",
+        endpoint_url="http://localhost:4566",
+        verify_bucket=verify_bucket,
+    )
+
+    called = [name for name, _ in client.calls]
+    assert called == (["head_bucket", "put_object"] if verify_bucket else ["put_object"])
+    assert client.calls[-1][1]["Body"] is body